@@ -4,6 +4,11 @@ from typing import List, Optional
 import yaml
 import os
 
+try:  # libyaml-биндинги в разы быстрее чистого Python; формат файла тот же
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
 CONFIG_PATH = os.getenv("BOT_CONFIG_PATH", "bot/config.yaml")
 
 @dataclass
@@ -37,7 +42,7 @@ def load_config() -> AppConfig:
         save_config(cfg)
         return cfg
     with open(CONFIG_PATH, "r", encoding="utf-8") as f:
-        raw = yaml.safe_load(f) or {}
+        raw = yaml.load(f, Loader=_YamlLoader) or {}
     # простая ручная десериализация
     sched = raw.get("bablo", {}).get("schedule", {}) if raw else {}
     schedule = RunSchedule(**sched) if sched else RunSchedule()
@@ -59,4 +64,4 @@ def load_config() -> AppConfig:
 def save_config(cfg: AppConfig) -> None:
     os.makedirs(os.path.dirname(CONFIG_PATH), exist_ok=True)
     with open(CONFIG_PATH, "w", encoding="utf-8") as f:
-        yaml.safe_dump({"bablo": asdict(cfg.bablo)}, f, sort_keys=False, allow_unicode=True)
+        yaml.dump({"bablo": asdict(cfg.bablo)}, f, Dumper=_YamlDumper, sort_keys=False, allow_unicode=True)
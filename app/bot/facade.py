@@ -1,5 +1,6 @@
 from __future__ import annotations
 import asyncio
+import contextlib
 import logging
 from datetime import datetime, time as dtime
 from typing import Optional
@@ -10,7 +11,7 @@ from solders.keypair import Keypair
 from aiogram import Bot
 
 # Импорты из core
-from app.core.bablo_bot import Bablo, BabloConfig
+from app.core.bablo_bot import Bablo, BabloConfig, build_rpc_client, close_metadata_http
 from app.core.constants import LAMPORTS_PER_SOL
 from app.core.utils import lamports_to_sol  # если потребуется
 from app.core.wallet_manager import WalletManager     # у тебя этот класс в wallet_manager.py
@@ -98,10 +99,14 @@ class BabloController:
         # Ссылки на рабочие объекты
         self.wallets: Optional[WalletManager] = None
         self.bablo: Optional[Bablo] = None
+        # Один SolanaClient на все циклы: без нового TLS-рукопожатия и холодного blockhash на каждый запуск
+        self._client: Optional[SolanaClient] = None
 
         # Фоновые задачи
         self._autorun_task: Optional[asyncio.Task] = None
         self._run_lock = asyncio.Lock()
+        # contracts.txt и конфиг: load→mutate→save идёт через to_thread, без лока шаги перемежаются
+        self._storage_lock = asyncio.Lock()
 
         # Лог в ТГ (установим только если есть бот и admin)
         self._install_telemetry_logger()
@@ -140,6 +145,11 @@ class BabloController:
         except Exception as e:
             log.exception("Failed to send message to admin: %s", e)
 
+    def _get_client(self) -> SolanaClient:
+        if self._client is None:
+            self._client = build_rpc_client()
+        return self._client
+
     def _build_bablo(self) -> Bablo:
         bc = self.cfg.bablo
         # BabloConfig из твоего core
@@ -161,13 +171,14 @@ class BabloController:
             await self._send(f"🟠 <b>Alert</b>\n<pre>{safe}</pre>")
 
         async def get_ca() -> str:
-            contracts = load_contracts()
-            if not contracts:
-                raise RuntimeError("CA не задан. Используй /set_ca <MINT>")
-            ca = contracts.pop(0)
-            save_contracts(contracts)
-            self.cfg.bablo.last_ca = ca
-            save_config(self.cfg)
+            async with self._storage_lock:
+                contracts = await asyncio.to_thread(load_contracts)
+                if not contracts:
+                    raise RuntimeError("CA не задан. Используй /set_ca <MINT>")
+                ca = contracts.pop(0)
+                await asyncio.to_thread(save_contracts, contracts)
+                self.cfg.bablo.last_ca = ca
+                await asyncio.to_thread(save_config, self.cfg)
             return ca
 
         b = Bablo(
@@ -175,33 +186,29 @@ class BabloController:
             on_status=on_status,
             on_alert=on_alert,
             get_ca=get_ca,
+            client=self._get_client(),
         )
         return b
 
-    async def _ensure_wallets(self):
+    def _ensure_wallets(self) -> WalletManager:
         if self.wallets is None:
-            # Создаём WalletManager лениво. WalletManager в твоём проекте может требовать SolanaClient экземпляр.
-            # Здесь передаём None если конструкция позволяет — в противном случае нужно создать SolanaClient(...) и передать.
+            # WalletManager лениво, на том же SolanaClient, что и Bablo: один пул соединений на процесс
             try:
-                self.wallets = WalletManager(client=None)  # type: ignore[arg-type]
-            except Exception:
-                # Попробуем через реальный клиент (fallback)
-                try:
-                    client = SolanaClient(os.getenv("RPC_HTTP_URL", ""))
-                    self.wallets = WalletManager(client=client)  # type: ignore[arg-type]
-                except Exception as e:
-                    log.exception("Failed to create WalletManager: %s", e)
-                    raise
+                self.wallets = WalletManager(client=self._get_client())
+            except Exception as e:
+                log.exception("Failed to create WalletManager: %s", e)
+                raise
         return self.wallets
 
     # ---------- Public API ----------
     async def set_ca(self, ca: str):
         clean = ca.strip()
-        contracts = load_contracts()
-        contracts.append(clean)
-        save_contracts(contracts)
-        self.cfg.bablo.last_ca = clean
-        save_config(self.cfg)
+        async with self._storage_lock:
+            contracts = await asyncio.to_thread(load_contracts)
+            contracts.append(clean)
+            await asyncio.to_thread(save_contracts, contracts)
+            self.cfg.bablo.last_ca = clean
+            await asyncio.to_thread(save_config, self.cfg)
         await self._send(f"📌 Добавлен CA: <code>{escape(clean)}</code>")
 
     async def set_param(self, key: str, value: str):
@@ -236,12 +243,13 @@ class BabloController:
             if flag and not self._autorun_task:
                 self._autorun_task = asyncio.create_task(self._autorun_loop())
             elif not flag and self._autorun_task:
-                self._autorun_task.cancel()
-                self._autorun_task = None
+                await self._cancel_autorun()
         else:
             raise ValueError(f"Неизвестный параметр: {key}")
 
-        save_config(self.cfg)
+        # тот же лок, что у get_ca/set_ca: одновременно конфиг пишет только один поток
+        async with self._storage_lock:
+            await asyncio.to_thread(save_config, self.cfg)
         await self._send(f"✅ Параметр <b>{escape(key)}</b> обновлён.")
 
     async def run_once(self):
@@ -257,7 +265,7 @@ class BabloController:
                 self.bablo.dev = Keypair()
                 dev_pub = self.bablo.dev.pubkey()
             else:
-                wallets = await self._ensure_wallets()
+                wallets = self._ensure_wallets()
                 self.bablo.dev = wallets.dev
                 dev_pub = wallets.dev_pubkey
 
@@ -283,6 +291,25 @@ class BabloController:
             await self._send("⏹ Остановлено.")
             self.bablo = None
 
+    async def close(self):
+        """Завершение процесса: гасим автозапуск и цикл, закрываем общие HTTP-пулы."""
+        await self._cancel_autorun()
+        if self.bablo is not None:
+            await self.bablo.stop()
+            self.bablo = None
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+        await close_metadata_http()
+
+    async def _cancel_autorun(self):
+        """Отменяет автозапуск и дожидается его очистки, прежде чем трогать общие ресурсы."""
+        task, self._autorun_task = self._autorun_task, None
+        if task and not task.done():
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
     def _within_active_window(self) -> bool:
         sched = self.cfg.bablo.schedule
 
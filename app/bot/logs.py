@@ -1,35 +1,62 @@
 import logging
 import asyncio
+from collections import deque
 from typing import Callable
 
 class TelegramLogHandler(logging.Handler):
     """
     Логгер-Handler, который шлёт сообщения в Telegram через переданный send_fn(chat_id, text).
-    Имеет минимальную защиту от спама (очередь и sleep).
+    Записи копятся в ограниченном буфере (при переполнении теряются самые старые),
+    один фоновый drain-таск склеивает накопленное в сообщения до лимита Telegram.
     """
-    def __init__(self, send_fn: Callable[[int, str], "asyncio.Future"], chat_id: int, level=logging.INFO):
+    def __init__(
+        self,
+        send_fn: Callable[[int, str], "asyncio.Future"],
+        chat_id: int,
+        level=logging.INFO,
+        max_buffer: int = 200,
+    ):
         super().__init__(level=level)
         self.send_fn = send_fn
         self.chat_id = chat_id
-        self._lock = asyncio.Lock()
+        self._buf: deque[str] = deque(maxlen=max_buffer)
+        self._task: asyncio.Task | None = None
 
     def emit(self, record: logging.LogRecord) -> None:
         try:
             msg = self.format(record)
         except Exception:
             return
-        # fire-and-forget в фоне
-        asyncio.create_task(self._safe_send(msg))
+        self._buf.append(msg)
+        if self._task is None or self._task.done():
+            try:
+                self._task = asyncio.get_running_loop().create_task(self._drain())
+            except RuntimeError:
+                # вне event loop отправлять некому — запись дождётся следующего emit
+                pass
 
-    async def _safe_send(self, msg: str):
-        # простая защита от бурста
-        async with self._lock:
+    async def _drain(self):
+        while self._buf:
+            text = self._take_batch()
             try:
-                await self.send_fn(self.chat_id, f"<code>{self._clip(msg)}</code>")
+                await self.send_fn(self.chat_id, f"<code>{text}</code>")
             except Exception:
                 pass
+            # простая защита от бурста
             await asyncio.sleep(0.15)
 
+    def _take_batch(self, limit: int = 3500) -> str:
+        parts: list[str] = []
+        size = 0
+        while self._buf:
+            m = self._clip(self._buf[0], limit)
+            if parts and size + len(m) + 1 > limit:
+                break
+            self._buf.popleft()
+            parts.append(m)
+            size += len(m) + 1
+        return "\n".join(parts)
+
     @staticmethod
     def _clip(s: str, limit: int = 3500) -> str:
         return s if len(s) <= limit else s[:limit] + " …"
@@ -33,4 +33,7 @@ async def run() -> None:
         await bot.send_message(boot_chat_id, "✅ Bot up (mode=bot)")
         await bot.send_message(boot_chat_id, "Меню настроек", reply_markup=main_menu_kb())
 
-    await dp.start_polling(bot)
+    try:
+        await dp.start_polling(bot)
+    finally:
+        await controller.close()
@@ -10,7 +10,7 @@ The path to the file used for storing contracts is configurable via the
 """
 
 from pathlib import Path
-from typing import List
+from typing import List, Optional, Tuple
 import os
 
 from aiogram.fsm.state import StatesGroup, State
@@ -22,18 +22,33 @@ from .settings import SETTINGS
 
 CONTRACTS_STORAGE_PATH = Path(os.getenv("CONTRACTS_STORAGE_PATH", "contracts.txt"))
 
+# (st_mtime_ns, st_size) -> разобранный список; файл перечитывается только после изменения
+_CONTRACTS_CACHE: Optional[Tuple[Tuple[int, int], List[str]]] = None
+
 
 def load_contracts() -> List[str]:
     """Load list of contract addresses from ``CONTRACTS_STORAGE_PATH``.
 
-    Returns an empty list if the file does not exist.
+    Returns an empty list if the file does not exist. The parsed list is
+    cached by file mtime/size, so repeated calls skip reading the file.
     """
 
-    if not CONTRACTS_STORAGE_PATH.exists():
+    global _CONTRACTS_CACHE
+
+    try:
+        st = CONTRACTS_STORAGE_PATH.stat()
+    except FileNotFoundError:
+        _CONTRACTS_CACHE = None
         return []
 
+    key = (st.st_mtime_ns, st.st_size)
+    if _CONTRACTS_CACHE is not None and _CONTRACTS_CACHE[0] == key:
+        return list(_CONTRACTS_CACHE[1])
+
     with CONTRACTS_STORAGE_PATH.open("r", encoding="utf-8") as fh:
-        return [line.strip() for line in fh if line.strip()]
+        contracts = [line.strip() for line in fh if line.strip()]
+    _CONTRACTS_CACHE = (key, contracts)
+    return list(contracts)
 
 
 def save_contracts(contracts: List[str]) -> None:
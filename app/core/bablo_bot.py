@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import random
 import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from typing import Awaitable, Callable, Optional
 
@@ -14,7 +16,6 @@ from solders.instruction import Instruction
 from spl.token.instructions import (
     create_associated_token_account,
     create_idempotent_associated_token_account,
-    get_associated_token_address,
     mint_to_checked, MintToCheckedParams,
     set_authority, SetAuthorityParams, AuthorityType,
     sync_native, SyncNativeParams, close_account, CloseAccountParams
@@ -22,6 +23,7 @@ from spl.token.instructions import (
 
 from .dto import TokenDTO, LiquidityPoolData
 from .client import SolanaClient
+from .config import settings
 from .constants import (
     TOKEN_DECIMALS, TOKEN_WITH_DECIMALS,
     TOKEN_PROGRAM_2022_ID, TOKEN_PROGRAM_ID,
@@ -35,6 +37,8 @@ from .ix_builders import (
     build_initialize_token_metadata_ix,
     build_initialize_pool_ix,
     build_withdraw_ix,
+    AMM_CONFIG_ADDRESS,
+    POOL_AUTHORITY_ADDRESS,
 )
 from .utils import (
     sol_to_lamports,
@@ -42,7 +46,7 @@ from .utils import (
     tokens_ui_to_base_units,
     calculate_lp_tokens,
     get_token_amount_after_fee,
-    get_amm_config_address, get_pool_address, get_authority_address,
+    get_pool_address, get_ata_address,
     get_pool_vault_address, get_oracle_account_address, get_pool_lp_mint_address,
 )
 from .ws_hub import WsHub
@@ -71,6 +75,32 @@ TRANSFER_FEE_BPS = 1000
 TRANSFER_FEE_PERCENT = int(TRANSFER_FEE_BPS // 100)
 
 SUPPLY = 1_000_000_000
+SUPPLY_BASE_UNITS = SUPPLY * TOKEN_WITH_DECIMALS
+TRANSFER_FEE_MAX = 1_000_000_000 * TOKEN_WITH_DECIMALS
+
+# Один keep-alive клиент на процесс для getAsset и off-chain json метаданных
+_METADATA_HTTP: Optional[httpx.AsyncClient] = None
+
+def _metadata_http() -> httpx.AsyncClient:
+    global _METADATA_HTTP
+    if _METADATA_HTTP is None or _METADATA_HTTP.is_closed:
+        _METADATA_HTTP = httpx.AsyncClient(timeout=20.0)
+    return _METADATA_HTTP
+
+async def close_metadata_http() -> None:
+    """Закрывает общий клиент метаданных; при следующем запросе он создастся заново."""
+    global _METADATA_HTTP
+    if _METADATA_HTTP is not None:
+        await _METADATA_HTTP.aclose()
+        _METADATA_HTTP = None
+
+# original mint -> (name, symbol, uri): getAsset + json_uri тянем один раз на CA
+# LRU с потолком: в auto-режиме процесс живёт долго, а CA всё время новые
+METADATA_CACHE_MAX = 256
+_METADATA_CACHE: OrderedDict[str, tuple[str, str, str]] = OrderedDict()
+
+def build_rpc_client() -> SolanaClient:
+    return SolanaClient(HELIUS_HTTPS, max_calls=50, broadcast_endpoints=settings.broadcast_rpc_urls)
 
 class Bablo:
     def __init__(
@@ -81,6 +111,7 @@ class Bablo:
         on_alert: Optional[OnAlert] = None,
         get_ca: Optional[GetCA] = None,            # manual
         get_ca_auto: Optional[GetCAAuto] = None,   # auto (может вернуть None → заснём)
+        client: Optional[SolanaClient] = None,     # общий клиент: пул соединений и кэш blockhash живут между циклами
     ):
         self._cfg = cfg or BabloConfig()
         self.on_status: OnStatus = on_status or (lambda s: asyncio.sleep(0))
@@ -88,7 +119,9 @@ class Bablo:
         self.get_ca: Optional[GetCA] = get_ca
         self.get_ca_auto: Optional[GetCAAuto] = get_ca_auto
 
-        self._client = SolanaClient(HELIUS_HTTPS, max_calls=50)
+        # свой клиент закрываем в close(); переданный снаружи закрывает владелец
+        self._owns_client = client is None
+        self._client = client or build_rpc_client()
         self._ws = WsHub()
         self._wm = WalletManager(self._client)
 
@@ -141,6 +174,13 @@ class Bablo:
             except asyncio.CancelledError:
                 pass
 
+    async def close(self):
+        """Останавливает цикл и закрывает HTTP-пулы (при завершении процесса)."""
+        await self.stop()
+        if self._owns_client:
+            await self._client.close()
+        await close_metadata_http()
+
     async def working_loop(self):
         try:
             while not self._stopped():
@@ -155,15 +195,28 @@ class Bablo:
                     continue
 
                 self.original_mint = Pubkey.from_string(ca)
-                self.token = await self._copy_token_metadata(ca)
-                await self._say(f"Метаданные: {self.token.name} ({self.token.symbol})")
-
-                async with self._wm.dev_cycle() as cycle_dev:
-                    seed_target = self.lamports_amount + LAUNCH_COST_LAMPORTS
-                    added = await self._ensure_dev_funded_for(cycle_dev.pubkey(), seed_target, use_locked=True)
-                    if added:
-                        await self._say(f"Dev докинут на {added} лампорт(ов).")
-                    await self._cycle_with_dev(cycle_dev)
+                # метаданные (getAsset + json_uri) не зависят от dev — тянем параллельно с пополнением
+                meta_task = asyncio.create_task(self._copy_token_metadata(ca), name="bablo-copy-metadata")
+                meta_awaited = False
+                try:
+                    async with self._wm.dev_cycle() as cycle_dev:
+                        seed_target = self.lamports_amount + LAUNCH_COST_LAMPORTS
+                        added = await self._ensure_dev_funded_for(cycle_dev.pubkey(), seed_target, use_locked=True)
+                        if added:
+                            await self._say(f"Dev докинут на {added} лампорт(ов).")
+
+                        meta_awaited = True
+                        self.token = await meta_task
+                        await self._say(f"Метаданные: {self.token.name} ({self.token.symbol})")
+                        await self._cycle_with_dev(cycle_dev)
+                finally:
+                    if not meta_task.done():
+                        meta_task.cancel()
+                        with contextlib.suppress(asyncio.CancelledError, Exception):
+                            await meta_task
+                    elif not meta_awaited and not meta_task.cancelled() and meta_task.exception() is not None:
+                        # цикл упал до await meta_task — забираем ошибку метаданных, чтобы не потерялась
+                        log.warning("Metadata copy for %s failed: %s", ca, meta_task.exception())
 
                 #await self._wm.rollover_dev(seed_lamports=seed_target, from_dev=cycle_dev)
                 if self._cfg.mode == "auto":
@@ -204,13 +257,10 @@ class Bablo:
         pnl_task: Optional[asyncio.Task] = None
 
         try:
-            balance = (await self._client.get_multiple_accounts_lamports_balances([self._wm.fund_pubkey]))[0]
-            log.info(f"Balance: {lamports_to_sol(balance)}")
-
             self.tx_create_token = await self._create_token(dev)
             await self._say(f"Создан mint: `{self.token.keypair.pubkey()}`; tx: `{self.tx_create_token}`")
 
-            self.pool = await self._prepare_liquidity_pool(dev)
+            self.pool = self._prepare_liquidity_pool(dev)
             self.tx_init_pool = await self._initialize_pool(dev)
             await self._say(f"Пул инициирован: `{self.pool.pool_state}`; tx: `{self.tx_init_pool}`")
 
@@ -219,19 +269,16 @@ class Bablo:
                 name="bablo-pnl-worker"
             )
 
-            timer_task = asyncio.create_task(asyncio.sleep(self._cfg.cycle_timeout_sec), name="bablo-timer")
-            pnl_wait_task = asyncio.create_task(pnl_event.wait(), name="bablo-pnl-wait")
-
-            t0 = time.time()
-            done, pending = await asyncio.wait({timer_task, pnl_wait_task}, return_when=asyncio.FIRST_COMPLETED)
-            log.info("Timer stop:  elapsed=%.3fs", time.time() - t0)
+            # 0 — таймер отключён, ждём только PnL-триггер
+            timeout = self._cfg.cycle_timeout_sec or None
+            loop = asyncio.get_running_loop()
+            t0 = loop.time()
+            try:
+                await asyncio.wait_for(pnl_event.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+            log.info("Timer stop:  elapsed=%.3fs", loop.time() - t0)
 
-            for t in pending:
-                t.cancel()
-                try:
-                    await t
-                except asyncio.CancelledError:
-                    pass
             ws_stop.set()
             if pnl_task:
                 pnl_task.cancel()
@@ -251,28 +298,39 @@ class Bablo:
 
     @staticmethod
     async def _copy_token_metadata(original_mint_str: str) -> TokenDTO:
+        cached = _METADATA_CACHE.get(original_mint_str)
+        if cached is not None:
+            _METADATA_CACHE.move_to_end(original_mint_str)
+            name, symbol, uri = cached
+            # keypair всегда новый: каждый запуск — свой mint
+            return TokenDTO(name=name, symbol=symbol, uri=uri, keypair=Keypair())
         try:
-            async with httpx.AsyncClient(timeout=20.0) as client:
-                resp = await client.post(
-                    follow_redirects=True,
-                    url=HELIUS_HTTPS,
-                    headers={'Content-Type': 'application/json'},
-                    json={"jsonrpc": "2.0", "id": "1", "method": "getAsset", "params": {"id": original_mint_str}},
-                )
-                resp.raise_for_status()
-                result = resp.json().get('result', {})
-                json_uri = result.get('content', {}).get('json_uri')
-                if not json_uri:
-                    raise RuntimeError("json_uri не найден в контенте ассета")
-
-                meta_resp = await client.get(url=json_uri)
-                meta_resp.raise_for_status()
-                meta = meta_resp.json()
+            client = _metadata_http()
+            resp = await client.post(
+                follow_redirects=True,
+                url=HELIUS_HTTPS,
+                headers={'Content-Type': 'application/json'},
+                json={"jsonrpc": "2.0", "id": "1", "method": "getAsset", "params": {"id": original_mint_str}},
+            )
+            resp.raise_for_status()
+            result = resp.json().get('result', {})
+            json_uri = result.get('content', {}).get('json_uri')
+            if not json_uri:
+                raise RuntimeError("json_uri не найден в контенте ассета")
+
+            meta_resp = await client.get(url=json_uri)
+            meta_resp.raise_for_status()
+            meta = meta_resp.json()
 
             mint_kp = Keypair()
+            name = meta.get("name") or "ClonedToken"
+            symbol = meta.get("symbol") or "CLONE"
+            _METADATA_CACHE[original_mint_str] = (name, symbol, json_uri)
+            if len(_METADATA_CACHE) > METADATA_CACHE_MAX:
+                _METADATA_CACHE.popitem(last=False)
             return TokenDTO(
-                name=meta.get("name") or "ClonedToken",
-                symbol=meta.get("symbol") or "CLONE",
+                name=name,
+                symbol=symbol,
                 uri=json_uri,
                 keypair=mint_kp,
             )
@@ -281,69 +339,74 @@ class Bablo:
 
     async def _create_token(self, dev: Keypair) -> str:
         assert self.token
-        ixs: list[Instruction] = []
-        ixs.append(create_account(CreateAccountParams(
-            from_pubkey=dev.pubkey(),
-            to_pubkey=self.token.keypair.pubkey(),
-            lamports=CREATE_MINT_ACCOUNT_LAMPORTS,
-            space=CREATE_MINT_ACCOUNT_SPACE,
-            owner=TOKEN_PROGRAM_2022_ID
-        )))
-        ixs.append(build_initialize_transfer_fee_config_ix(
-            mint=self.token.keypair.pubkey(),
-            authority=dev.pubkey(),
-            basis_points=TRANSFER_FEE_BPS,
-            max_fee=1_000_000_000 * TOKEN_WITH_DECIMALS,
-        ))
-        ixs.append(build_initialize_metadata_pointer_ix(
-            mint=self.token.keypair.pubkey(),
-            authority=dev.pubkey(),
-            metadata_address=self.token.keypair.pubkey()
-        ))
-        ixs.append(build_initialize_mint_ix(
-            mint=self.token.keypair.pubkey(),
-            mint_authority=dev.pubkey(),
-            freeze_authority=dev.pubkey(),
-            decimals=TOKEN_DECIMALS,
-        ))
-        ixs.append(build_initialize_token_metadata_ix(
-            metadata=self.token.keypair.pubkey(),
-            update_authority=dev.pubkey(),
-            mint=self.token.keypair.pubkey(),
-            mint_authority=dev.pubkey(),
-            name=self.token.name,
-            symbol=self.token.symbol,
-            uri=self.token.uri,
-        ))
-        ixs.append(create_associated_token_account(
-            payer=dev.pubkey(),
-            owner=dev.pubkey(),
-            mint=self.token.keypair.pubkey(),
-            token_program_id=TOKEN_PROGRAM_2022_ID,
-        ))
-        ixs.append(mint_to_checked(MintToCheckedParams(
-            program_id=TOKEN_PROGRAM_2022_ID,
-            mint=self.token.keypair.pubkey(),
-            dest=get_associated_token_address(owner=dev.pubkey(), mint=self.token.keypair.pubkey(), token_program_id=TOKEN_PROGRAM_2022_ID),
-            mint_authority=dev.pubkey(),
-            amount=SUPPLY * TOKEN_WITH_DECIMALS,
-            decimals=TOKEN_DECIMALS,
-        )))
-        # снять авторитеты
-        ixs.append(set_authority(SetAuthorityParams(
-            program_id=TOKEN_PROGRAM_2022_ID,
-            account=self.token.keypair.pubkey(),
-            authority=AuthorityType.MINT_TOKENS,
-            current_authority=dev.pubkey(),
-            new_authority=None,
-        )))
-        ixs.append(set_authority(SetAuthorityParams(
-            program_id=TOKEN_PROGRAM_2022_ID,
-            account=self.token.keypair.pubkey(),
-            authority=AuthorityType.FREEZE_ACCOUNT,
-            current_authority=dev.pubkey(),
-            new_authority=None,
-        )))
+        # pubkey() в solders каждый раз создаёт новый объект — берём один раз на транзакцию
+        mint = self.token.keypair.pubkey()
+        dev_pk = dev.pubkey()
+        # список литералом: все инструкции известны заранее, без append на каждую
+        ixs: list[Instruction] = [
+            create_account(CreateAccountParams(
+                from_pubkey=dev_pk,
+                to_pubkey=mint,
+                lamports=CREATE_MINT_ACCOUNT_LAMPORTS,
+                space=CREATE_MINT_ACCOUNT_SPACE,
+                owner=TOKEN_PROGRAM_2022_ID
+            )),
+            build_initialize_transfer_fee_config_ix(
+                mint=mint,
+                authority=dev_pk,
+                basis_points=TRANSFER_FEE_BPS,
+                max_fee=TRANSFER_FEE_MAX,
+            ),
+            build_initialize_metadata_pointer_ix(
+                mint=mint,
+                authority=dev_pk,
+                metadata_address=mint
+            ),
+            build_initialize_mint_ix(
+                mint=mint,
+                mint_authority=dev_pk,
+                freeze_authority=dev_pk,
+                decimals=TOKEN_DECIMALS,
+            ),
+            build_initialize_token_metadata_ix(
+                metadata=mint,
+                update_authority=dev_pk,
+                mint=mint,
+                mint_authority=dev_pk,
+                name=self.token.name,
+                symbol=self.token.symbol,
+                uri=self.token.uri,
+            ),
+            create_associated_token_account(
+                payer=dev_pk,
+                owner=dev_pk,
+                mint=mint,
+                token_program_id=TOKEN_PROGRAM_2022_ID,
+            ),
+            mint_to_checked(MintToCheckedParams(
+                program_id=TOKEN_PROGRAM_2022_ID,
+                mint=mint,
+                dest=get_ata_address(dev_pk, mint, TOKEN_PROGRAM_2022_ID),
+                mint_authority=dev_pk,
+                amount=SUPPLY_BASE_UNITS,
+                decimals=TOKEN_DECIMALS,
+            )),
+            # снять авторитеты
+            set_authority(SetAuthorityParams(
+                program_id=TOKEN_PROGRAM_2022_ID,
+                account=mint,
+                authority=AuthorityType.MINT_TOKENS,
+                current_authority=dev_pk,
+                new_authority=None,
+            )),
+            set_authority(SetAuthorityParams(
+                program_id=TOKEN_PROGRAM_2022_ID,
+                account=mint,
+                authority=AuthorityType.FREEZE_ACCOUNT,
+                current_authority=dev_pk,
+                new_authority=None,
+            )),
+        ]
 
         sig, _ = await self._client.build_and_send_transaction(
             instructions=ixs,
@@ -356,13 +419,13 @@ class Bablo:
         )
         return str(sig)
 
-    async def _prepare_liquidity_pool(self, dev: Keypair) -> LiquidityPoolData:
+    def _prepare_liquidity_pool(self, dev: Keypair) -> LiquidityPoolData:
         assert self.token
         created_token_mint = self.token.keypair.pubkey()
         creator = dev.pubkey()
 
-        token_ata = get_associated_token_address(owner=creator, mint=created_token_mint, token_program_id=TOKEN_PROGRAM_2022_ID)
-        wsol_ata = get_associated_token_address(owner=creator, mint=SOL_WRAPPED_MINT)
+        token_ata = get_ata_address(creator, created_token_mint, TOKEN_PROGRAM_2022_ID)
+        wsol_ata = get_ata_address(creator, SOL_WRAPPED_MINT)
 
         is_token_first = bytes(created_token_mint) < bytes(SOL_WRAPPED_MINT)
         token_mint0 = created_token_mint if is_token_first else SOL_WRAPPED_MINT
@@ -378,11 +441,10 @@ class Bablo:
         token_1_ata = wsol_ata if is_token_first else token_ata
 
         program_id = RAYDIUM_CP_PROGRAM_ID
-        amm_config = get_amm_config_address(index=0, program_id=program_id)
-        authority = get_authority_address(program_id=program_id)
-        pool_state = get_pool_address(amm_config=amm_config, token_mint0=token_mint0, token_mint1=token_mint1, program_id=program_id)
+        authority = POOL_AUTHORITY_ADDRESS
+        pool_state = get_pool_address(amm_config=AMM_CONFIG_ADDRESS, token_mint0=token_mint0, token_mint1=token_mint1, program_id=program_id)
         lp_mint = get_pool_lp_mint_address(pool_state, program_id)
-        creator_lp_token = get_associated_token_address(owner=creator, mint=lp_mint)
+        creator_lp_token = get_ata_address(creator, lp_mint)
         token0_vault = get_pool_vault_address(pool=pool_state, vault_token_mint=token_mint0, program_id=program_id)
         token1_vault = get_pool_vault_address(pool=pool_state, vault_token_mint=token_mint1, program_id=program_id)
         observation = get_oracle_account_address(pool=pool_state, program_id=program_id)
@@ -414,10 +476,11 @@ class Bablo:
 
     async def _initialize_pool(self, dev: Keypair) -> str:
         assert self.pool
-        wsol_ata = get_associated_token_address(owner=dev.pubkey(), mint=SOL_WRAPPED_MINT)
+        wsol_ata = self.pool.creator_wsol_ata
+        dev_pk = dev.pubkey()
 
-        create_wsol_ata_ix = create_idempotent_associated_token_account(payer=dev.pubkey(), owner=dev.pubkey(), mint=SOL_WRAPPED_MINT)
-        transfer_sol_ix = transfer(TransferParams(from_pubkey=dev.pubkey(), to_pubkey=wsol_ata, lamports=self.lamports_amount))
+        create_wsol_ata_ix = create_idempotent_associated_token_account(payer=dev_pk, owner=dev_pk, mint=SOL_WRAPPED_MINT)
+        transfer_sol_ix = transfer(TransferParams(from_pubkey=dev_pk, to_pubkey=wsol_ata, lamports=self.lamports_amount))
         sync_native_ix = sync_native(SyncNativeParams(account=wsol_ata, program_id=TOKEN_PROGRAM_ID))
         init_ix = build_initialize_pool_ix(tx_data=self.pool, open_time_unix=int(time.time()))
         ixs = [create_wsol_ata_ix, transfer_sol_ix, sync_native_ix, init_ix]
@@ -432,10 +495,11 @@ class Bablo:
         return str(sig)
 
     async def _withdraw_liquidity(self, txd: LiquidityPoolData) -> str:
+        creator = txd.creator_kp.pubkey()
         withdraw_ix = build_withdraw_ix(tx_data=txd, lp_token_amount=txd.lp_amount or 0)
-        create_wsol_ata_ix = create_idempotent_associated_token_account(payer=txd.creator_kp.pubkey(), owner=txd.creator_kp.pubkey(), mint=SOL_WRAPPED_MINT)
-        wsol_ata = get_associated_token_address(owner=txd.creator_kp.pubkey(), mint=SOL_WRAPPED_MINT)
-        close_wsol_ata_ix = close_account(CloseAccountParams(program_id=TOKEN_PROGRAM_ID, account=wsol_ata, dest=self._wm.fund_pubkey, owner=txd.creator_kp.pubkey()))
+        create_wsol_ata_ix = create_idempotent_associated_token_account(payer=creator, owner=creator, mint=SOL_WRAPPED_MINT)
+        wsol_ata = txd.creator_wsol_ata
+        close_wsol_ata_ix = close_account(CloseAccountParams(program_id=TOKEN_PROGRAM_ID, account=wsol_ata, dest=self._wm.fund_pubkey, owner=creator))
         sig, _ = await self._client.build_and_send_transaction(
             instructions=[create_wsol_ata_ix, withdraw_ix, close_wsol_ata_ix],
             msg_signer=self._wm.fund,
@@ -448,12 +512,14 @@ class Bablo:
         return str(sig)
 
     async def _monitor_pnl_wrapper(self, sol_vault: Pubkey, event: asyncio.Event, stop_event: asyncio.Event):
-        init_sol = self.wsol_amount_ui
+        # всё, что не меняется за цикл, считаем до подписки — колбэк дёргается на каждый апдейт
+        cost_sol = self.wsol_amount_ui + LAUNCH_COST_SOL
+        threshold_sol = self._cfg.profit_threshold_sol
         async def on_value(lamports: int):
             current_sol = lamports_to_sol(lamports)
-            pnl = current_sol - init_sol - LAUNCH_COST_SOL
+            pnl = current_sol - cost_sol
             log.info("WS: SOL=%.6f, PnL=%.6f", current_sol, pnl)
-            if pnl >= self._cfg.profit_threshold_sol:
+            if pnl >= threshold_sol:
                 event.set()
                 stop_event.set()
         try:
@@ -478,7 +544,9 @@ class Bablo:
 
     async def _ensure_dev_funded_for(self, dev_pubkey: Pubkey, target_lamports: int, *,
                                      use_locked: bool = False) -> int:
-        bal = (await self._client.get_multiple_accounts_lamports_balances([dev_pubkey]))[0]
+        # dev и фонд одним getMultipleAccounts вместо двух отдельных запросов
+        bal, fund_bal = await self._client.get_multiple_accounts_lamports_balances([dev_pubkey, self._wm.fund_pubkey])
+        log.info("Balance: %s", lamports_to_sol(fund_bal))
         shortfall = max(0, target_lamports - bal)
         if shortfall > 0:
             if use_locked:
@@ -4,12 +4,15 @@ import asyncio
 import time
 import random
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from collections.abc import Callable
 from inspect import Signature
 from typing import Any, Optional
+from solana.exceptions import SolanaRpcException
 from solana.rpc.async_api import AsyncClient
+from solana.rpc.core import RPCException, RPCNoResultException
 from solana.rpc.commitment import Processed, Commitment, Confirmed
-from solana.rpc.types import TxOpts
+from solana.rpc.types import TxOpts, DataSliceOpts
 from solders.compute_budget import set_compute_unit_limit, set_compute_unit_price
 from solders.hash import Hash
 from solders.instruction import Instruction
@@ -22,23 +25,71 @@ from solders.system_program import transfer, TransferParams
 
 from .logger import logger
 
+class RpcError(Exception):
+    """Ошибка, которую вернул RPC (или Jito) в теле ответа."""
+
+class TransactionNotConfirmedError(Exception):
+    """Транзакция не подтвердилась за отведённое число попыток."""
+
+# Пул соединений к RPC: держим keep-alive дольше пауз между этапами цикла
+# (ожидание PnL), чтобы не платить TLS-рукопожатием за каждый новый вызов
+RPC_HTTP_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=64, keepalive_expiry=120.0)
+
+# Декодируем base58 один раз при импорте, а не на каждую отправку
+JITO_TIP_ACCOUNT = Pubkey.from_string("96gYZGLnJYVFmbjzopPSU6QiEV5fGqZNyN9nmNhvrZU5")
+JITO_RPC_SEND_TX = "https://mainnet.block-engine.jito.wtf/api/v1/transactions"
+
+# Максимальный размер сериализованной транзакции (IPv6 MTU минус заголовки)
+PACKET_DATA_SIZE = 1232
+
+# getMultipleAccounts принимает не больше 100 ключей за вызов
+MULTIPLE_ACCOUNTS_CHUNK = 100
+# для балансов данные аккаунта не нужны — просим пустой срез
+LAMPORTS_ONLY_SLICE = DataSliceOpts(offset=0, length=0)
+
+# Ожидаемые сбои RPC-вызова. solana-py заворачивает транспортные ошибки httpx
+# в SolanaRpcException, а ошибку из тела ответа отдаёт как RPCException / RPCNoResultException
+RPC_TRANSIENT_ERRORS = (RpcError, httpx.HTTPError, SolanaRpcException, RPCException, RPCNoResultException)
+# Ожидаемые сбои отправки: на них build_and_send_transaction делает повтор
+RETRYABLE_TX_ERRORS = (TransactionNotConfirmedError, *RPC_TRANSIENT_ERRORS)
+
+def unique_signers(signers: list[Keypair]) -> list[Keypair]:
+    """Убирает повторы по pubkey с сохранением порядка: каждый ключ подписывает транзакцию один раз."""
+    by_pubkey: dict[Pubkey, Keypair] = {}
+    for kp in signers:
+        by_pubkey.setdefault(kp.pubkey(), kp)
+    return list(by_pubkey.values())
+
+def estimate_tx_size(msg: Message) -> int:
+    """Размер будущей транзакции без подписания: 1 байт счётчика + 64 на подпись + Message."""
+    return 1 + 64 * msg.header.num_required_signatures + len(bytes(msg))
+
+def sign_transaction(msg: Message, signers: list[Keypair], blockhash: Hash) -> Transaction:
+    """Подписывает готовый Message (CPU: ed25519 на каждого подписанта)."""
+    return Transaction(signers, msg, blockhash)
+
 class AsyncRateLimiter:
+    """
+    Скользящее окно: не больше max_calls запросов за per_seconds.
+    Ожидающие встают в очередь на lock и спят ровно до освобождения слота,
+    а не крутятся по 10ms — так всплеск не пробивает лимит и не ловит 429.
+    """
     def __init__(self, max_calls: int, per_seconds: float):
         self.max_calls = max_calls
         self.per_seconds = per_seconds
         self.calls = deque()
+        self._lock = asyncio.Lock()
 
     async def wait(self):
-        now = time.monotonic()
-        while len(self.calls) >= self.max_calls:
-            elapsed = now - self.calls[0]
-            if elapsed < self.per_seconds:
-                wait_time = self.per_seconds - elapsed
-                await asyncio.sleep(min(wait_time, 0.01))
+        async with self._lock:
+            while True:
                 now = time.monotonic()
-            else:
-                self.calls.popleft()
-        self.calls.append(now)
+                while self.calls and now - self.calls[0] >= self.per_seconds:
+                    self.calls.popleft()
+                if len(self.calls) < self.max_calls:
+                    self.calls.append(now)
+                    return
+                await asyncio.sleep(self.per_seconds - (now - self.calls[0]))
 
 class ExponentialBackoff:
     def __init__(self, min_delay=0.2, max_delay=5.0, factor=2.0, jitter=0.2):
@@ -51,7 +102,7 @@ class ExponentialBackoff:
     async def delay(self):
         jitter = random.uniform(1 - self.jitter, 1 + self.jitter)
         delay = min(self._current * jitter, self.max_delay)
-        logger.warning(f"[Backoff] Sleeping for {delay:.2f}s due to rate limit...")
+        logger.warning("[Backoff] Sleeping for %.2fs due to rate limit...", delay)
         await asyncio.sleep(delay)
         self._current = min(self._current * self.factor, self.max_delay)
 
@@ -71,29 +122,42 @@ class PatchedHttpxClient(httpx.AsyncClient):
             response = await super().send(request, *args, **kwargs)
 
             if response.status_code != 429:
+                self._backoff.reset()
                 return response
 
-            logger.warning(f"[PatchedHttpxClient] 429 Too Many Requests → attempt {attempt+1}/{self._max_retries} for {request.url}")
+            logger.warning("[PatchedHttpxClient] 429 Too Many Requests → attempt %d/%d for %s", attempt + 1, self._max_retries, request.url)
             await self._backoff.delay()
 
-        logger.error(f"[PatchedHttpxClient] Giving up after {self._max_retries} retries → {request.url}")
+        logger.error("[PatchedHttpxClient] Giving up after %d retries → %s", self._max_retries, request.url)
         raise httpx.HTTPStatusError("429 Too Many Requests (max retries)", request=request, response=response)
 
 class SolanaClient:
-    def __init__(self, rpc_endpoint: str, max_calls=10, per_seconds=0.9):
+    def __init__(
+        self,
+        rpc_endpoint: str,
+        max_calls=10,
+        per_seconds=0.9,
+        broadcast_endpoints: Optional[list[str]] = None,
+    ):
         """Initialize Solana client with RPC endpoint.
 
         Args:
             rpc_endpoint: URL of the Solana RPC endpoint
+            broadcast_endpoints: extra RPC URLs that receive a copy of every sent transaction
         """
         self.rpc_endpoint = rpc_endpoint
         self._client = None
-        self._cached_blockhash: Hash | None = None
+        self._broadcast_endpoints = [ep for ep in (broadcast_endpoints or []) if ep and ep != rpc_endpoint]
+        self._http: Optional[httpx.AsyncClient] = None
+        # ссылки на фоновые broadcast-задачи, иначе их может собрать GC до завершения
+        self._broadcast_tasks: set[asyncio.Task] = set()
         self._limiter = AsyncRateLimiter(max_calls=max_calls, per_seconds=per_seconds)
 
         self._cached_blockhash: Optional[Hash] = None
         self._cached_blockhash_ts: float = 0.0
         self._blockhash_ttl_s: float = 15.0
+        self._blockhash_lock = asyncio.Lock()
+        self._sign_pool: Optional[ThreadPoolExecutor] = None
 
     async def _fetch_blockhash(self, commitment=Processed) -> Hash:
         client = await self.get_client()
@@ -101,13 +165,18 @@ class SolanaClient:
         bh: Hash = resp.value.blockhash
         self._cached_blockhash = bh
         self._cached_blockhash_ts = time.monotonic()
-        logger.debug(f"[blockhash] fetched: {bh}")
+        logger.debug("[blockhash] fetched: %s", bh)
         return bh
 
     async def get_client(self) -> AsyncClient:
         if self._client is None:
             raw_client = AsyncClient(self.rpc_endpoint)
-            patched_httpx = PatchedHttpxClient(base_url=self.rpc_endpoint, timeout=10.0, limiter=self._limiter)
+            patched_httpx = PatchedHttpxClient(
+                base_url=self.rpc_endpoint,
+                timeout=10.0,
+                limits=RPC_HTTP_LIMITS,
+                limiter=self._limiter,
+            )
             raw_client._provider.session = patched_httpx
             self._client = raw_client
         return self._client
@@ -124,10 +193,10 @@ class SolanaClient:
                     msg = err.get("message") if isinstance(err, dict) else str(err)
 
                     if "429" in msg or "Too Many Requests" in msg:
-                        logger.warning(f"[429] RPC response error: {msg}")
+                        logger.warning("[429] RPC response error: %s", msg)
                         await backoff.delay()
                         continue
-                    raise Exception(f"RPC error: {msg}")
+                    raise RpcError(f"RPC error: {msg}")
 
                 return result
 
@@ -143,6 +212,61 @@ class SolanaClient:
         if self._client:
             await self._client.close()
             self._client = None
+        for task in self._broadcast_tasks:
+            task.cancel()
+        self._broadcast_tasks.clear()
+        if self._http:
+            await self._http.aclose()
+            self._http = None
+        if self._sign_pool:
+            self._sign_pool.shutdown(wait=False)
+            self._sign_pool = None
+
+    async def _sign(self, msg: Message, signers: list[Keypair], blockhash: Hash) -> Transaction:
+        """Подписывает транзакцию в отдельном потоке, чтобы не блокировать event loop."""
+        if self._sign_pool is None:
+            self._sign_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="tx-sign")
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._sign_pool, sign_transaction, msg, signers, blockhash)
+
+    def _get_http(self) -> httpx.AsyncClient:
+        """Общий keep-alive клиент для запросов мимо solana-py: broadcast на доп. RPC и Jito."""
+        if self._http is None:
+            self._http = httpx.AsyncClient(timeout=10.0, limits=RPC_HTTP_LIMITS)
+        return self._http
+
+    def _spawn_broadcast(self, raw_tx: bytes) -> None:
+        """Запускает broadcast фоном: основная отправка и подтверждение не ждут медленные доп. RPC."""
+        if not self._broadcast_endpoints:
+            return
+        task = asyncio.create_task(self._broadcast_raw_transaction(raw_tx), name="tx-broadcast")
+        self._broadcast_tasks.add(task)
+        task.add_done_callback(self._broadcast_tasks.discard)
+
+    async def _broadcast_raw_transaction(self, raw_tx: bytes) -> None:
+        """
+        Дублирует уже подписанную транзакцию на дополнительные RPC параллельно с основной отправкой.
+        Сигнатура одна и та же, поэтому сеть примет её только один раз; ошибки лишь логируем.
+        """
+        if not self._broadcast_endpoints:
+            return
+        http = self._get_http()
+        payload = {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "sendTransaction",
+            "params": [
+                base64.b64encode(raw_tx).decode("ascii"),
+                {"encoding": "base64", "skipPreflight": True},
+            ],
+        }
+        results = await asyncio.gather(
+            *(http.post(ep, json=payload) for ep in self._broadcast_endpoints),
+            return_exceptions=True,
+        )
+        for ep, res in zip(self._broadcast_endpoints, results):
+            if isinstance(res, Exception):
+                logger.debug("[TX] broadcast to %s failed: %s", ep, res)
 
     async def get_account_info(self, pubkey: Pubkey, encoding="base64") -> AccountJSON | Account:
         """Get account info from the blockchain.
@@ -170,7 +294,7 @@ class SolanaClient:
                     raise ValueError(f"Account {pubkey} not found")
                 return response.value
         except Exception as e:
-            logger.error(f"Errow while collecting account info {encoding}: {e}")
+            logger.error("Errow while collecting account info %s: %s", encoding, e)
 
     async def get_token_account_balance(self, token_account: Pubkey) -> int:
         """Get token balance for an account.
@@ -188,7 +312,7 @@ class SolanaClient:
                 return int(response.value.amount)
             return 0
         except Exception as e:
-            logger.debug(f"Error while collecting token account balacne: {e}")
+            logger.debug("Error while collecting token account balacne: %s", e)
             return 0
 
     async def get_minimum_balance_for_rent_exemption(self, usize: int):
@@ -199,41 +323,58 @@ class SolanaClient:
                 return int(response.value)
             return 3_000_000
         except Exception:
-            logger.debug(f"Error while collecting minimum amount for rent, fallback to 3,000,000")
+            logger.debug("Error while collecting minimum amount for rent, fallback to 3,000,000")
             return 3_000_000
 
     async def get_multiple_accounts_lamports_balances(self, accounts: list[Pubkey]) -> list[int]:
-        """Get token balance for an account.
+        """Get lamports balances for accounts.
 
         Args:
-            accounts: account addresses
+            accounts: account addresses (any count: split into chunks of 100, fetched concurrently)
 
         Returns:
-            Token balance as integer
+            Balances in lamports, in the same order; 0 for missing accounts
         """
         try:
             client = await self.get_client()
-            response = await self._execute_with_retry(lambda: client.get_multiple_accounts(accounts))
-            if response.value:
-                balances = []
-                for i, value in enumerate(response.value):
-                    try:
-                        balances.append(int(value.lamports))
-                    except AttributeError:
-                        balances.append(0)
-                        continue
-                return balances
-            return []
+            chunks = [
+                accounts[i:i + MULTIPLE_ACCOUNTS_CHUNK]
+                for i in range(0, len(accounts), MULTIPLE_ACCOUNTS_CHUNK)
+            ]
+            responses = await asyncio.gather(*(
+                self._execute_with_retry(
+                    lambda chunk=chunk: client.get_multiple_accounts(chunk, data_slice=LAMPORTS_ONLY_SLICE)
+                )
+                for chunk in chunks
+            ))
+            balances = []
+            for response in responses:
+                if not response.value:
+                    return []
+                balances.extend(value.lamports if value is not None else 0 for value in response.value)
+            return balances
         except Exception as e:
-            logger.warning(f"Error while collecting multiple accoints lamports balance: {e}")
+            logger.warning("Error while collecting multiple accoints lamports balance: %s", e)
             return []
 
+    def _blockhash_fresh(self) -> bool:
+        return (
+            self._cached_blockhash is not None
+            and (time.monotonic() - self._cached_blockhash_ts) <= self._blockhash_ttl_s
+        )
+
+    def invalidate_blockhash(self) -> None:
+        """Сбрасывает кэш: следующий get_latest_blockhash сходит в RPC."""
+        self._cached_blockhash = None
+
     async def get_latest_blockhash(self, *, commitment=Processed) -> Hash:
-        """Возвращает blockhash с кэшем 15s."""
-        now = time.monotonic()
-        if self._cached_blockhash is None or (now - self._cached_blockhash_ts) > self._blockhash_ttl_s:
+        """Возвращает blockhash с кэшем 15s. Одновременно идёт не более одного обновления."""
+        if self._blockhash_fresh():
+            return self._cached_blockhash
+        async with self._blockhash_lock:
+            if self._blockhash_fresh():
+                return self._cached_blockhash
             return await self._fetch_blockhash(commitment=commitment)
-        return self._cached_blockhash
 
     async def build_signed_raw_transaction(
         self,
@@ -248,11 +389,8 @@ class SolanaClient:
         Собирает Message, добавляет ComputeBudget (опционально), берёт кэшированный blockhash,
         подписывает и возвращает сериализованные байты транзакции.
         """
-        if signers is None:
-            signers = [payer]
-        else:
-            if payer not in signers:
-                signers = [payer, *signers]
+        # payer всегда первым, повторы по pubkey отбрасываем
+        signers = unique_signers([payer, *(signers or ())])
 
         ixs: list[Instruction] = []
         if compute_unit_limit is not None:
@@ -261,16 +399,18 @@ class SolanaClient:
             ixs.append(set_compute_unit_price(priority_fee_microlamports))
         ixs.extend(instructions)
 
-        blockhash: Hash = await self.get_latest_blockhash()
+        # проверяем размер до подписи: не тратим ed25519 и blockhash на заведомо негодную транзакцию
         msg = Message(ixs, payer.pubkey())
-        tx = Transaction(signers, msg, blockhash)
-        raw = bytes(tx)
-
-        if len(raw) > 1232:
-            logger.info(len(raw))
+        size = estimate_tx_size(msg)
+        if size > PACKET_DATA_SIZE:
+            logger.info("[TX] too large: %d bytes > %d", size, PACKET_DATA_SIZE)
             return bytes()
 
-        logger.debug(f"[TX] built size={len(raw)} bytes; signers={len(signers)}")
+        blockhash: Hash = await self.get_latest_blockhash()
+        tx = await self._sign(msg, signers, blockhash)
+        raw = bytes(tx)
+
+        logger.debug("[TX] built size=%d bytes; signers=%d", len(raw), len(signers))
         return raw
 
     async def send_raw_transaction(self, raw_tx: bytes, *, skip_preflight: bool = True) -> str:
@@ -281,7 +421,7 @@ class SolanaClient:
         opts = TxOpts(skip_preflight=skip_preflight, preflight_commitment=Processed)
         await self._execute_with_retry(lambda: client.send_raw_transaction(raw_tx, opts=opts))
         sig = Transaction.from_bytes(raw_tx).signatures[0]
-        logger.info(f"[TX] raw sent: {str(sig)}")
+        logger.info("[TX] raw sent: %s", sig)
         return str(sig)
 
     async def build_and_send_transaction(
@@ -316,14 +456,10 @@ class SolanaClient:
         if jito_tip >= 1000:
             JITO = True
 
-        JITO_TIP_ACCOUNT = Pubkey.from_string("96gYZGLnJYVFmbjzopPSU6QiEV5fGqZNyN9nmNhvrZU5")
-        JITO_RPC_SEND_TX = "https://mainnet.block-engine.jito.wtf/api/v1/transactions"
-
         client = await self.get_client()
+        payer = msg_signer.pubkey()
 
-        logger.info(
-            f"Priority fee in microlamports: {priority_fee if priority_fee else 0}"
-        )
+        logger.debug("Priority fee in microlamports: %d", priority_fee or 0)
 
         if compute_limit is not None:
             compute_limit_ix = set_compute_unit_limit(compute_limit)
@@ -332,73 +468,80 @@ class SolanaClient:
             unit_price_ix = set_compute_unit_price(priority_fee)
             instructions = [unit_price_ix, *instructions]
 
-        recent_blockhash = await self.get_latest_blockhash()
-
         if JITO: # Minimum lamports to Jito
             tip_ix = transfer(
                 TransferParams(
-                    from_pubkey=msg_signer.pubkey(),
+                    from_pubkey=payer,
                     to_pubkey=JITO_TIP_ACCOUNT,
                     lamports=jito_tip
                 )
             )
             instructions = [tip_ix, *instructions]
 
-        message = Message(instructions, msg_signer.pubkey())
-        transaction = Transaction(signers_keypairs, message, recent_blockhash)
+        # Message компилируем один раз: по нему же меряем размер и подписываем
+        msg = Message(instructions, payer)
+        size = estimate_tx_size(msg)
+        if size > PACKET_DATA_SIZE:
+            raise ValueError(f"{label} TX too large: {size} bytes > {PACKET_DATA_SIZE}")
+
+        # payer подписывает первым, повторы по pubkey отбрасываем
+        signers = unique_signers([msg_signer, *signers_keypairs])
 
-        logger.info(f"Transaction size: {len(bytes(transaction))} bytes")
         success = False
+        tx_opts = TxOpts(skip_preflight=skip_preflight, preflight_commitment=Processed)
+        raw_tx: Optional[bytes] = None
+        b64_tx = ""
 
         for attempt in range(max_retries):
             try:
-                tx_opts = TxOpts(
-                    skip_preflight=skip_preflight, preflight_commitment=Processed
-                )
-                logger.info(f"Sending {label} TX...")
+                if raw_tx is None:
+                    # подписываем и сериализуем один раз; заново — только если RPC отверг blockhash
+                    recent_blockhash = await self.get_latest_blockhash()
+                    raw_tx = bytes(await self._sign(msg, signers, recent_blockhash))
+                    b64_tx = base64.b64encode(raw_tx).decode("utf-8") if JITO else ""
+                    logger.debug("Transaction size: %d bytes", len(raw_tx))
+
+                logger.debug("Sending %s TX...", label)
                 if JITO:
-                    b64_tx = base64.b64encode(bytes(transaction)).decode("utf-8")
-
-                    async with httpx.AsyncClient() as _cl:
-                        payload = {
-                            "jsonrpc": "2.0",
-                            "id": 1,
-                            "method": "sendTransaction",
-                            "params": [
-                                b64_tx,
-                                {
-                                    "encoding": "base64"
-                                }
-                            ]
-                        }
-
-                    resp = await _cl.post(f"{JITO_RPC_SEND_TX}?bundleOnly=true", json=payload)
+                    payload = {
+                        "jsonrpc": "2.0",
+                        "id": 1,
+                        "method": "sendTransaction",
+                        "params": [
+                            b64_tx,
+                            {
+                                "encoding": "base64"
+                            }
+                        ]
+                    }
+                    resp = await self._get_http().post(f"{JITO_RPC_SEND_TX}?bundleOnly=true", json=payload)
                     if resp.status_code != 200:
-                        raise Exception(f"Jito returned HTTP {resp.status_code}: {resp.text}")
+                        raise RpcError(f"Jito returned HTTP {resp.status_code}: {resp.text}")
 
                     result = resp.json()
                     if "error" in result:
-                        raise Exception(f"Jito RPC error: {result['error']}")
+                        raise RpcError(f"Jito RPC error: {result['error']}")
                     sig = result["result"]
-                    await self._execute_with_retry(lambda: self.confirm_transaction(signature=sig, max_retries=max_confirm_retries))
+                    await self.confirm_transaction(signature=sig, max_retries=max_confirm_retries)
 
                 else:
-                    response = await self._execute_with_retry(lambda: client.send_transaction(transaction, tx_opts))
+                    self._spawn_broadcast(raw_tx)
+                    response = await self._execute_with_retry(lambda: client.send_raw_transaction(raw_tx, opts=tx_opts))
                     sig = response.value
-                    success = await self._execute_with_retry(lambda: self.confirm_transaction(signature=sig, max_retries=max_confirm_retries))
-                    logger.info(f"{label} TX sent: {sig}\nSuccess: {success}")
-
-            except Exception as e:
+                    success = await self.confirm_transaction(signature=sig, max_retries=max_confirm_retries)
+                    logger.info("%s TX sent: %s\nSuccess: %s", label, sig, success)
+
+            except RETRYABLE_TX_ERRORS as e:
+                if "blockhash" in str(e).lower():
+                    # RPC не знает наш blockhash — кэш сбрасываем, следующая попытка переподпишет
+                    self.invalidate_blockhash()
+                    raw_tx = None
                 if attempt == max_retries - 1:
-                    logger.error(
-                        f"Failed to send/ transaction after {max_retries} attempts"
-                    )
+                    logger.error("Failed to send/ transaction after %d attempts", max_retries)
                     raise
 
                 wait_time = 0.5 ** attempt
-                logger.warning(
-                    f"Transaction attempt {attempt + 1} failed: {e!s}, retrying in {wait_time}s"
-                )
+                logger.warning("Transaction attempt %d failed: %s, retrying in %ss", attempt + 1, e, wait_time)
                 await asyncio.sleep(wait_time)
 
         return sig, success
@@ -412,10 +555,10 @@ class SolanaClient:
     ) -> SimulateTransactionResp:
 
         client = await self.get_client()
-        recent_blockhash = await self._execute_with_retry(lambda: self.get_latest_blockhash())
-        message = Message(instructions, msg_signer.pubkey())
-        transaction = Transaction(signers_keypairs, message, recent_blockhash)
-        logger.info(f"Transaction size: {len(bytes(transaction))} bytes")
+        recent_blockhash = await self.get_latest_blockhash()
+        msg = Message(instructions, msg_signer.pubkey())
+        transaction = await self._sign(msg, unique_signers([msg_signer, *signers_keypairs]), recent_blockhash)
+        logger.debug("Transaction size: %d bytes", len(bytes(transaction)))
 
         return await self._execute_with_retry(lambda: client.simulate_transaction(
             transaction,
@@ -436,11 +579,11 @@ class SolanaClient:
                 res = await self._execute_with_retry(lambda: client.get_signature_statuses([signature]))
                 status = res.value[0]
                 if status and status.confirmations is not None:
-                    logger.info(f"Confirmed TX {signature} on attempt {attempt + 1}")
+                    logger.info("Confirmed TX %s on attempt %d", signature, attempt + 1)
                     return True
-            except Exception as e:
-                logger.warning(f"Error checking status for TX {signature}: {e!s}")
+            except RPC_TRANSIENT_ERRORS as e:
+                logger.warning("Error checking status for TX %s: %s", signature, e)
             await asyncio.sleep(1)
 
-        logger.warning(f"TX {signature} not confirmed after {max_retries} attempts")
-        raise
\ No newline at end of file
+        logger.warning("TX %s not confirmed after %d attempts", signature, max_retries)
+        raise TransactionNotConfirmedError(f"TX {signature} not confirmed after {max_retries} attempts")
\ No newline at end of file
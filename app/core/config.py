@@ -11,6 +11,10 @@ class Settings(BaseModel):
     run_mode: str = Field(default=os.getenv("RUN_MODE", "cli"))
     bot_token: str = Field(default=os.getenv("BOT_TOKEN", ""))
     log_level: str = Field(default=os.getenv("LOG_LEVEL", "INFO"))
+    # доп. RPC, куда дублируется каждая подписанная транзакция; по умолчанию — никуда
+    broadcast_rpc_urls: list[str] = Field(
+        default=[u.strip() for u in os.getenv("BROADCAST_RPC_URLS", "").split(",") if u.strip()]
+    )
 
 settings = Settings()
 settings.wallets_dir.mkdir(parents=True, exist_ok=True)
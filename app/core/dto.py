@@ -4,7 +4,9 @@ from typing import Optional
 from solders.pubkey import Pubkey
 from solders.solders import Keypair
 
-@dataclass
+from .constants import SOL_WRAPPED_MINT
+
+@dataclass(slots=True)
 class LiquidityPoolData:
     creator_kp: Keypair
     token_mint0: Pubkey
@@ -31,6 +33,11 @@ class LiquidityPoolData:
     random_pool_id: Optional[Pubkey] = None
     lp_amount: int = 0
 
+    @property
+    def creator_wsol_ata(self) -> Pubkey:
+        """wSOL ATA создателя — уже выведен при подготовке пула, повторно не считаем."""
+        return self.token_0_ata if self.token_mint0 == SOL_WRAPPED_MINT else self.token_1_ata
+
     def to_json_dict(self) -> dict:
         return {
             **{field: str(getattr(self, field)) for field in (
@@ -74,7 +81,7 @@ class LiquidityPoolData:
             lp_amount=int(data["lp_amount"])
         )
 
-@dataclass
+@dataclass(slots=True)
 class TokenDTO:
     name: str
     symbol: str
@@ -23,55 +23,76 @@ from .utils import (
     get_authority_address,
 )
 
-from construct import Struct, Bytes, Int32ul, Int16ul, Int64ul, Int8ul
-
 WITHDRAW_DISCRIMINATOR: Final[bytes] = bytes([183, 18, 70, 156, 148, 109, 161, 34])
 SWAP_BASE_INPUT_DISCRIMINATOR = bytes([143, 190, 90, 218, 196, 30, 51, 222])
 INITIALIZE_DISCRIMINATOR: Final[bytes] = bytes([175, 175, 109, 31, 13, 152, 155, 237])
 
+# PDA конфига и authority пула не зависят от токена — считаем один раз при импорте
+AMM_CONFIG_ADDRESS: Final[Pubkey] = get_amm_config_address(index=AMM_CONFIG_INDEX, program_id=RAYDIUM_CP_PROGRAM_ID)
+POOL_AUTHORITY_ADDRESS: Final[Pubkey] = get_authority_address(program_id=RAYDIUM_CP_PROGRAM_ID)
+
+# Общий для initialize и withdraw: SPL Token program, readonly
+_TOKEN_PROGRAM_META = AccountMeta(TOKEN_PROGRAM_ID, is_signer=False, is_writable=False)
+
+# Неизменяемые AccountMeta для initialize пула — одни и те же для любого токена
+_INIT_AMM_CONFIG_META = AccountMeta(AMM_CONFIG_ADDRESS, is_signer=False, is_writable=False)
+_INIT_AUTHORITY_META = AccountMeta(POOL_AUTHORITY_ADDRESS, is_signer=False, is_writable=False)
+_INIT_FEE_RECEIVER_META = AccountMeta(CREATE_POOL_FEE_RECEIVER_ID, is_signer=False, is_writable=True)
+_INIT_ATA_PROGRAM_META = AccountMeta(ASSOCIATED_TOKEN_ACCOUNT_PROGRAM, is_signer=False, is_writable=False)
+_INIT_SYSTEM_PROGRAM_META = AccountMeta(SYS_PROGRAM_ID, is_signer=False, is_writable=False)
+_INIT_RENT_META = AccountMeta(SYS_VAR_RENT_ID, is_signer=False, is_writable=False)
+
+# То же для withdraw: программы не меняются от пула к пулу
+_WITHDRAW_TOKEN_2022_PROGRAM_META = AccountMeta(TOKEN_PROGRAM_2022_ID, is_signer=False, is_writable=False)
+_WITHDRAW_MEMO_PROGRAM_META = AccountMeta(MEMO_PROGRAM_ID, is_signer=False, is_writable=False)
+
 METADATA_DISCRIMINATOR = bytes.fromhex("d2e11ea258b84d8d")
 
-MetadataStruct = Struct(
-    "discriminator" / Bytes(8),
-    "name" / Int32ul >> Bytes(lambda ctx: len(ctx._.name.encode("utf-8"))),
-    "symbol" / Int32ul >> Bytes(lambda ctx: len(ctx._.symbol.encode("utf-8"))),
-    "uri" / Int32ul >> Bytes(lambda ctx: len(ctx._.uri.encode("utf-8"))),
-)
+# discriminator + три u64: данные initialize и withdraw собираются одним pack
+_DISCRIMINATOR_3U64 = struct.Struct("<8sQQQ")
+
+# InitializeTransferFeeConfig: [26, 0] ... basis_points (u16) + max_fee (u64)
+TRANSFER_FEE_CONFIG_PREFIX: Final[bytes] = bytes((26, 0))
+_TRANSFER_FEE_TAIL = struct.Struct("<HQ")
+
+# borsh-строка: u32 длина (LE) + utf-8 байты
+_PACK_U32 = struct.Struct("<I").pack
 
 METADATA_POINTER_DISCRIMINATOR = 39
 METADATA_POINTER_SUB_DISCRIMINATOR = 0
+METADATA_POINTER_INIT_PREFIX: Final[bytes] = bytes((METADATA_POINTER_DISCRIMINATOR, METADATA_POINTER_SUB_DISCRIMINATOR))
+
+_ZERO_PUBKEY_BYTES: Final[bytes] = bytes(32)
 
 def encode_zeroable_option(pubkey: Pubkey | None) -> bytes:
     if pubkey is None:
-        return b'\x00' * 32
+        return _ZERO_PUBKEY_BYTES
     return bytes(pubkey)
 
 def encode_string(s: str) -> bytes:
     encoded = s.encode("utf-8")
-    return Int32ul.build(len(encoded)) + encoded
+    return _PACK_U32(len(encoded)) + encoded
 
 def encode_optional_pubkey(pubkey: Pubkey | None) -> bytes:
     if pubkey is None:
-        return bytes([0])
-    return bytes([1]) + bytes(pubkey)
+        return b"\x00"
+    return b"\x01" + bytes(pubkey)
 
 def build_initialize_pool_ix(
     tx_data: LiquidityPoolData,
     open_time_unix: int,
 ) -> Instruction:
 
-    data = (
-            INITIALIZE_DISCRIMINATOR +
-            struct.pack("<Q", tx_data.token_mint0_amount) +
-            struct.pack("<Q", tx_data.token_mint1_amount) +
-            struct.pack("<Q", open_time_unix)
+    data = _DISCRIMINATOR_3U64.pack(
+        INITIALIZE_DISCRIMINATOR,
+        tx_data.token_mint0_amount,
+        tx_data.token_mint1_amount,
+        open_time_unix,
     )
-    amm_config_pub = get_amm_config_address(index=AMM_CONFIG_INDEX, program_id=RAYDIUM_CP_PROGRAM_ID)
-    authority = get_authority_address(program_id=RAYDIUM_CP_PROGRAM_ID)
-    accounts = [
+    accounts = (
         AccountMeta(tx_data.creator_kp.pubkey(), is_signer=True, is_writable=True),   # creator
-        AccountMeta(amm_config_pub, is_signer=False, is_writable=False), # amm_config
-        AccountMeta(authority, is_signer=False, is_writable=False), # authority
+        _INIT_AMM_CONFIG_META, # amm_config
+        _INIT_AUTHORITY_META, # authority
         AccountMeta(tx_data.pool_state, is_signer=tx_data.random_pool_id is not None, is_writable=True),  # pool_state
         AccountMeta(tx_data.token_mint0, is_signer=False, is_writable=False), # token_0_mint
         AccountMeta(tx_data.token_mint1, is_signer=False, is_writable=False), # token_1_mint
@@ -81,15 +102,15 @@ def build_initialize_pool_ix(
         AccountMeta(tx_data.creator_lp_token, is_signer=False, is_writable=True),  # creator_lp_token
         AccountMeta(tx_data.token0_vault, is_signer=False, is_writable=True),  # token_0_vault
         AccountMeta(tx_data.token1_vault, is_signer=False, is_writable=True),  # token_1_vault
-        AccountMeta(CREATE_POOL_FEE_RECEIVER_ID, is_signer=False, is_writable=True),  # create_pool_fee
+        _INIT_FEE_RECEIVER_META,  # create_pool_fee
         AccountMeta(tx_data.observation, is_signer=False, is_writable=True),  # observation_state
-        AccountMeta(TOKEN_PROGRAM_ID, is_signer=False, is_writable=False), # token_program
+        _TOKEN_PROGRAM_META, # token_program
         AccountMeta(tx_data.token_0_program, is_signer=False, is_writable=False), # token_0_program
         AccountMeta(tx_data.token_1_program, is_signer=False, is_writable=False), # token_1_program
-        AccountMeta(ASSOCIATED_TOKEN_ACCOUNT_PROGRAM, is_signer=False, is_writable=False), # associated_token_program
-        AccountMeta(SYS_PROGRAM_ID, is_signer=False, is_writable=False),  # system_program
-        AccountMeta(SYS_VAR_RENT_ID, is_signer=False, is_writable=False), # rent
-    ]
+        _INIT_ATA_PROGRAM_META, # associated_token_program
+        _INIT_SYSTEM_PROGRAM_META,  # system_program
+        _INIT_RENT_META, # rent
+    )
     return Instruction(
         program_id=RAYDIUM_CP_PROGRAM_ID,
         data=data,
@@ -104,13 +125,8 @@ def build_withdraw_ix(
     min_token_1: int = 0,
 ) -> Instruction:
 
-    data = (
-        WITHDRAW_DISCRIMINATOR +
-        struct.pack("<Q", lp_token_amount) +
-        struct.pack("<Q", min_token_0) +
-        struct.pack("<Q", min_token_1)
-    )
-    accounts = [
+    data = _DISCRIMINATOR_3U64.pack(WITHDRAW_DISCRIMINATOR, lp_token_amount, min_token_0, min_token_1)
+    accounts = (
         AccountMeta(pubkey=tx_data.creator_kp.pubkey(), is_signer=True, is_writable=True),
         AccountMeta(pubkey=tx_data.authority, is_signer=False, is_writable=False),
         AccountMeta(pubkey=tx_data.pool_state, is_signer=False, is_writable=True),
@@ -119,13 +135,13 @@ def build_withdraw_ix(
         AccountMeta(pubkey=tx_data.token_1_ata, is_signer=False, is_writable=True),
         AccountMeta(pubkey=tx_data.token0_vault, is_signer=False, is_writable=True),
         AccountMeta(pubkey=tx_data.token1_vault, is_signer=False, is_writable=True),
-        AccountMeta(pubkey=TOKEN_PROGRAM_ID, is_signer=False, is_writable=False),
-        AccountMeta(pubkey=TOKEN_PROGRAM_2022_ID, is_signer=False, is_writable=False),
+        _TOKEN_PROGRAM_META,
+        _WITHDRAW_TOKEN_2022_PROGRAM_META,
         AccountMeta(pubkey=tx_data.token_mint0, is_signer=False, is_writable=False),
         AccountMeta(pubkey=tx_data.token_mint1, is_signer=False, is_writable=False),
         AccountMeta(pubkey=tx_data.lp_mint, is_signer=False, is_writable=True),
-        AccountMeta(pubkey=MEMO_PROGRAM_ID, is_signer=False, is_writable=False),
-    ]
+        _WITHDRAW_MEMO_PROGRAM_META,
+    )
     return Instruction(
         program_id=RAYDIUM_CP_PROGRAM_ID,
         data=data,
@@ -137,16 +153,13 @@ def build_initialize_metadata_pointer_ix(
     authority: Pubkey | None,
     metadata_address: Pubkey | None,
 ) -> Instruction:
-    data = bytes([
-        METADATA_POINTER_DISCRIMINATOR,
-        METADATA_POINTER_SUB_DISCRIMINATOR
-    ]) + encode_zeroable_option(authority) + encode_zeroable_option(metadata_address)
+    data = METADATA_POINTER_INIT_PREFIX + encode_zeroable_option(authority) + encode_zeroable_option(metadata_address)
 
     return Instruction(
         program_id=TOKEN_PROGRAM_2022_ID,
-        accounts=[
+        accounts=(
             AccountMeta(pubkey=mint, is_signer=False, is_writable=True),
-        ],
+        ),
         data=data
     )
 
@@ -168,12 +181,12 @@ def build_initialize_token_metadata_ix(
 
     return Instruction(
         program_id=TOKEN_PROGRAM_2022_ID,
-        accounts=[
+        accounts=(
             AccountMeta(pubkey=metadata, is_signer=False, is_writable=True),
             AccountMeta(pubkey=update_authority, is_signer=False, is_writable=False),
             AccountMeta(pubkey=mint, is_signer=False, is_writable=False),
             AccountMeta(pubkey=mint_authority, is_signer=True, is_writable=False),
-        ],
+        ),
         data=data
     )
 
@@ -184,23 +197,20 @@ def build_initialize_transfer_fee_config_ix(
     max_fee: int
 ) -> Instruction:
 
-    discriminator = 26
-    transfer_fee_discriminator = 0
-
-    data = bytes([
-        discriminator,
-        transfer_fee_discriminator,
-    ]) \
-    + encode_optional_pubkey(authority) \
-    + encode_optional_pubkey(authority) \
-    + Int16ul.build(basis_points) \
-    + Int64ul.build(max_fee)
+    # config и withdraw authority — один и тот же ключ
+    authority_bytes = encode_optional_pubkey(authority)
+    data = b"".join((
+        TRANSFER_FEE_CONFIG_PREFIX,
+        authority_bytes,
+        authority_bytes,
+        _TRANSFER_FEE_TAIL.pack(basis_points, max_fee),
+    ))
 
     return Instruction(
         program_id=TOKEN_PROGRAM_2022_ID,
-        accounts=[
+        accounts=(
             AccountMeta(pubkey=mint, is_signer=False, is_writable=True),
-        ],
+        ),
         data=data,
     )
 
@@ -211,23 +221,14 @@ def build_initialize_mint_ix(
     decimals: int,
 ) -> Instruction:
 
-    discriminator = Int8ul.build(0)
-    decimals_bytes = Int8ul.build(decimals)
-    mint_authority_bytes = bytes(mint_authority)
-    freeze_authority_bytes = encode_optional_pubkey(freeze_authority)
-
-    data = (
-        discriminator
-        + decimals_bytes
-        + mint_authority_bytes
-        + freeze_authority_bytes
-    )
+    # InitializeMint = 0, затем decimals (u8)
+    data = bytes((0, decimals)) + bytes(mint_authority) + encode_optional_pubkey(freeze_authority)
 
     return Instruction(
         program_id=TOKEN_PROGRAM_2022_ID,
-        accounts=[
+        accounts=(
             AccountMeta(pubkey=mint, is_signer=False, is_writable=True),
             AccountMeta(pubkey=SYS_VAR_RENT_ID, is_signer=False, is_writable=False),
-        ],
+        ),
         data=data,
     )
\ No newline at end of file
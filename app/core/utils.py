@@ -1,5 +1,8 @@
 import math
+from functools import lru_cache
+
 from solders.pubkey import Pubkey
+from spl.token.instructions import get_associated_token_address
 from .constants import (
     AMM_CONFIG_SEED,
     AUTH_SEED,
@@ -46,6 +49,11 @@ def get_creator_lp_mint(creator: Pubkey, lp_mint: Pubkey):
     )
     return result
 
+@lru_cache(maxsize=1024)
+def get_ata_address(owner: Pubkey, mint: Pubkey, token_program_id: Pubkey = TOKEN_PROGRAM_ID) -> Pubkey:
+    """ATA с кэшем: find_program_address перебирает bump с SHA256, а пары (owner, mint) повторяются."""
+    return get_associated_token_address(owner=owner, mint=mint, token_program_id=token_program_id)
+
 def get_oracle_account_address(pool: Pubkey, program_id: Pubkey) -> (Pubkey, int):
     result, _ = Pubkey.find_program_address([OBSERVATION_SEED, bytes(pool)], program_id)
     return result
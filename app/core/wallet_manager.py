@@ -1,29 +1,39 @@
 from __future__ import annotations
 
 import asyncio
-import base58
-
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Optional
 
 from dotenv import load_dotenv
 from solders.keypair import Keypair
 from solders.pubkey import Pubkey
 from solders.system_program import transfer, TransferParams
-from spl.token.instructions import get_associated_token_address, create_idempotent_associated_token_account
+from spl.token.instructions import create_idempotent_associated_token_account
 
 from .client import SolanaClient
 from .constants import SOL_WRAPPED_MINT
+from .utils import get_ata_address
 
 load_dotenv(override=False)
 
 WALLETS_DIR_DEFAULT = os.getenv("WALLETS_DIR", "wallets")
 FUND_PRIVATE_KEY_ENV = os.getenv("FUND_PRIVATE_KEY")
 
-@dataclass
+@lru_cache(maxsize=4)
+def load_fund_keypair(secret_b58: str) -> Keypair:
+    """Keypair фонда из base58; WalletManager создаётся на каждый запуск, ключ парсим один раз."""
+    return Keypair.from_base58_string(secret_b58)
+
+@dataclass(slots=True)
 class DevWallet:
     keypair: Keypair
+    pubkey: Pubkey = field(init=False)
+
+    def __post_init__(self):
+        # pubkey() в solders каждый раз создаёт новый объект — считаем один раз
+        self.pubkey = self.keypair.pubkey()
 
 class WalletManager:
     """
@@ -45,7 +55,8 @@ class WalletManager:
         self.wallets_dir = wallets_dir
         os.makedirs(self.wallets_dir, exist_ok=True)
 
-        self._fund = Keypair.from_base58_string(FUND_PRIVATE_KEY_ENV)
+        self._fund = load_fund_keypair(FUND_PRIVATE_KEY_ENV)
+        self._fund_pubkey = self._fund.pubkey()
         self._persist_wallet(self._fund)
 
         self._dev = self._create_dev()
@@ -58,7 +69,7 @@ class WalletManager:
 
     @property
     def fund_pubkey(self) -> Pubkey:
-        return self._fund.pubkey()
+        return self._fund_pubkey
 
     @property
     def dev(self) -> Keypair:
@@ -66,7 +77,7 @@ class WalletManager:
 
     @property
     def dev_pubkey(self) -> Pubkey:
-        return self._dev.keypair.pubkey()
+        return self._dev.pubkey
 
     async def _distribute_lamports_unlocked(self, lamports: int) -> str:
         if lamports <= 0:
@@ -163,7 +174,8 @@ class WalletManager:
         old_dev = from_dev or self._dev.keypair
         async with self._dev_lock:
             #sig1 = await self._withdraw_to_fund_unlocked(from_dev=old_dev)
-            self.update_dev()
+            # генерация ключа + запись файла — синхронный I/O, уводим с event loop
+            await asyncio.to_thread(self.update_dev)
             sig2 = await self._distribute_lamports_unlocked(seed_lamports)
             return "", sig2
 
@@ -185,7 +197,7 @@ class WalletManager:
 
     @staticmethod
     def get_wsol_ata(owner: Pubkey) -> Pubkey:
-        return get_associated_token_address(owner=owner, mint=SOL_WRAPPED_MINT)
+        return get_ata_address(owner, SOL_WRAPPED_MINT)
 
     @staticmethod
     def build_create_wsol_ata_ix(payer: Pubkey):
@@ -197,10 +209,8 @@ class WalletManager:
         return DevWallet(keypair=kp)
 
     def _persist_wallet(self, kp: Keypair) -> None:
-        try:
-            secret_b58 = base58.b58encode(kp.to_bytes()).decode()
-        except AttributeError as e:
-            raise RuntimeError(e)
+        # str(Keypair) — base58 64-байтного секрета, кодируется в Rust (solders)
+        secret_b58 = str(kp)
 
         path = os.path.join(self.wallets_dir, f"{kp.pubkey()}.txt")
         with open(path, "w", encoding="utf-8") as f:
@@ -10,6 +10,11 @@ from typing import Awaitable, Callable, Optional
 import websockets
 from .constants import HELIUS_WSS
 
+try:  # orjson парсит уведомления в разы быстрее stdlib json; необязательная зависимость
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 log = logging.getLogger(__name__)
 
 LamportsHandler = Callable[[int], Awaitable[None]]  # async def on_change(lamports:int)->None
@@ -103,36 +108,55 @@ class WsHub:
 
     @staticmethod
     async def _read_loop(ws, pubkey: str, on_change: LamportsHandler, stop_event: asyncio.Event):
+        # recv() гоняем наперегонки со stop_event: без поллинга по таймауту,
+        # и stop прерывает ожидание сообщения сразу
+        stop_task = asyncio.create_task(stop_event.wait())
+        recv_task: Optional[asyncio.Task] = None
+        try:
+            while not stop_event.is_set():
+                recv_task = asyncio.create_task(ws.recv())
+                await asyncio.wait({recv_task, stop_task}, return_when=asyncio.FIRST_COMPLETED)
+                if not recv_task.done():
+                    break
+                try:
+                    raw = recv_task.result()
+                except Exception:
+                    break
+                await WsHub._dispatch(raw, pubkey, on_change)
+        finally:
+            for t in (recv_task, stop_task):
+                if t and not t.done():
+                    t.cancel()
+                    try:
+                        await t
+                    except (asyncio.CancelledError, Exception):
+                        pass
+
+    @staticmethod
+    async def _dispatch(raw, pubkey: str, on_change: LamportsHandler):
+        try:
+            msg = _json_loads(raw)
+            params = msg.get("params")
+            if not params:
+                return
+            value = params.get("result", {}).get("value", {})
+            lamports = value.get("lamports")
+            if lamports is None:
+                return
+            await on_change(lamports)
+        except Exception as e:
+            log.error("[WS] handler error for %s: %s", pubkey, e)
+
+    @staticmethod
+    async def _ping_loop(ws, stop_event: asyncio.Event, *, interval: float = 20.0):
+        # спим до интервала или до stop — без тиков по 0.5s
         while not stop_event.is_set():
             try:
-                raw = await asyncio.wait_for(ws.recv(), timeout=1.0)
+                await asyncio.wait_for(stop_event.wait(), timeout=interval)
+                break
             except asyncio.TimeoutError:
-                continue
+                pass
+            try:
+                await ws.ping()
             except Exception:
                 break
-            try:
-                msg = json.loads(raw)
-                params = msg.get("params")
-                if not params:
-                    continue
-                value = params.get("result", {}).get("value", {})
-                lamports = value.get("lamports")
-                if lamports is None:
-                    continue
-                await on_change(lamports)
-            except Exception as e:
-                log.error("[WS] handler error for %s: %s", pubkey, e)
-
-    @staticmethod
-    async def _ping_loop(ws, stop_event: asyncio.Event, *, interval: float = 20.0):
-        tick = 0.5
-        elapsed = 0.0
-        while not stop_event.is_set():
-            if elapsed >= interval:
-                try:
-                    await ws.ping()
-                except Exception:
-                    break
-                elapsed = 0.0
-            await asyncio.sleep(tick)
-            elapsed += tick
@@ -3,7 +3,8 @@ from __future__ import annotations
 import argparse
 import asyncio
 import signal
-from typing import Optional
+import sys
+from typing import Any, Callable, Coroutine, Optional
 
 from core.config import settings
 from core.bablo_bot import Bablo, BabloConfig
@@ -13,6 +14,26 @@ from core.cli_config import get_cfg_from_user_cli, ainput
 _ca_queue: asyncio.Queue[str] = asyncio.Queue()
 
 
+def _fast_loop_factory() -> Optional[Callable[[], asyncio.AbstractEventLoop]]:
+    """Фабрика цикла uvloop (winloop на Windows), если пакет установлен; иначе None — стандартный цикл."""
+    try:
+        if sys.platform == "win32":
+            import winloop as fast_loop
+        else:
+            import uvloop as fast_loop
+    except ImportError:
+        return None
+    return fast_loop.new_event_loop
+
+def _run(coro: Coroutine[Any, Any, None]) -> None:
+    """asyncio.run на быстром цикле — через loop_factory, без глобальной event loop policy."""
+    factory = _fast_loop_factory()
+    if factory is None or not hasattr(asyncio, "Runner"):
+        asyncio.run(coro)
+        return
+    with asyncio.Runner(loop_factory=factory) as runner:
+        runner.run(coro)
+
 def _install_signal_handlers(stop_event: asyncio.Event) -> bool:
     try:
         loop = asyncio.get_running_loop()
@@ -132,7 +153,7 @@ async def run_cli():
 
             print("unknown command. Type 'help'.")
     finally:
-        await bablo.stop()
+        await bablo.close()
         log.info("CLI stopped.")
 
 
@@ -142,13 +163,12 @@ def main():
     args = parser.parse_args()
 
     mode = (args.run_mode or settings.run_mode).lower()
-
     if mode == "bot":
         from app.bot.runner import run as run_bot
 
-        asyncio.run(run_bot())
+        _run(run_bot())
     else:
-        asyncio.run(run_cli())
+        _run(run_cli())
 
 
 if __name__ == "__main__":
@@ -14,6 +14,8 @@ RPC_URL = os.getenv("RPC_URL", "https://mainnet.helius-rpc.com/?api-key=0d620e29
 COMBINED_FILE = "all_keys.txt"
 CHUNK_SIZE = 100
 TIMEOUT = 20.0
+MAX_CONCURRENT_CHUNKS = 4   # больше параллельных запросов публичный RPC режет 429
+CHUNK_RETRIES = 3
 
 # --- УТИЛИТЫ ---
 def _parse_secret_to_bytes(s: str) -> bytes:
@@ -42,6 +44,19 @@ def _parse_secret_to_bytes(s: str) -> bytes:
     except Exception as e:
         raise ValueError(f"cannot decode secret (expected json array / base58 / hex): {e}")
 
+def _keypair_from_base58(s: str) -> Optional[Keypair]:
+    """
+    Быстрый путь для самого частого формата — base58 64-байтного секрета:
+    декодирование в Rust (solders) вместо python-base58. None — если формат другой.
+    """
+    s = s.strip().strip(",")
+    if s.startswith("["):
+        return None
+    try:
+        return Keypair.from_base58_string(s)
+    except Exception:
+        return None
+
 def _load_secrets_from_combined(file_path: str) -> List[str]:
     if not os.path.exists(file_path):
         return []
@@ -77,6 +92,10 @@ def secrets_to_keypairs(secrets: List[str]) -> List[Tuple[str, Keypair]]:
     res: List[Tuple[str, Keypair]] = []
     for s in secrets:
         try:
+            kp = _keypair_from_base58(s)
+            if kp is not None:
+                res.append((s, kp))
+                continue
             sk_bytes = _parse_secret_to_bytes(s)
             # Solders ожидает 64 байта (секретный ключ), иногда дают 32 — обработаем это.
             if len(sk_bytes) == 32:
@@ -90,37 +109,51 @@ def secrets_to_keypairs(secrets: List[str]) -> List[Tuple[str, Keypair]]:
             print(f"[WARN] Skip secret: {str(e)}")
     return res
 
-async def fetch_balances(pubkeys: List[str]) -> Dict[str, int]:
-    balances: Dict[str, int] = {}
+async def _fetch_chunk(
+    client: httpx.AsyncClient, sem: asyncio.Semaphore, chunk: List[str], start: int,
+) -> Dict[str, Optional[int]]:
+    """
+    Балансы одного чанка. Упавший запрос повторяем с паузой; если все попытки
+    неудачны — у ключей чанка None (ошибка), а не 0, чтобы не выдать кошелёк за пустой.
+    """
+    payload = {
+        "jsonrpc": "2.0",
+        "id": 1,
+        "method": "getMultipleAccounts",
+        "params": [chunk, {"encoding": "jsonParsed", "commitment": "processed"}],
+    }
+    for attempt in range(CHUNK_RETRIES):
+        try:
+            async with sem:
+                r = await client.post(RPC_URL, json=payload)
+            r.raise_for_status()
+            data = r.json()
+            if "error" in data:
+                raise RuntimeError(f"RPC error: {data['error']}")
+            # Ответ: result -> value: [ { lamports, ... } or None ]
+            value = data["result"]["value"]
+            # None в value — аккаунта нет, это честный 0
+            return {pk: (acc or {}).get("lamports", 0) for pk, acc in zip(chunk, value)}
+        except Exception as e:
+            print(f"[ERR] RPC chunk [{start}:{start+len(chunk)}] attempt {attempt + 1}/{CHUNK_RETRIES} failed: {e}")
+            if attempt < CHUNK_RETRIES - 1:
+                await asyncio.sleep(2 ** attempt)
+    return {pk: None for pk in chunk}
+
+async def fetch_balances(pubkeys: List[str]) -> Dict[str, Optional[int]]:
+    balances: Dict[str, Optional[int]] = {}
     if not pubkeys:
         return balances
 
+    sem = asyncio.Semaphore(MAX_CONCURRENT_CHUNKS)
     async with httpx.AsyncClient(timeout=TIMEOUT) as client:
-        # Чанкуем запросы через getMultipleAccounts
-        for i in range(0, len(pubkeys), CHUNK_SIZE):
-            chunk = pubkeys[i:i+CHUNK_SIZE]
-            payload = {
-                "jsonrpc": "2.0",
-                "id": 1,
-                "method": "getMultipleAccounts",
-                "params": [chunk, {"encoding": "jsonParsed", "commitment": "processed"}],
-            }
-            try:
-                r = await client.post(RPC_URL, json=payload)
-                r.raise_for_status()
-                data = r.json()
-                # Ответ: result -> value: [ { lamports, ... } or None ]
-                value = (data.get("result") or {}).get("value") or []
-                for pk, acc in zip(chunk, value):
-                    lamports = 0
-                    if acc and "lamports" in acc:
-                        lamports = acc["lamports"]
-                    balances[pk] = lamports
-            except Exception as e:
-                print(f"[ERR] RPC chunk [{i}:{i+CHUNK_SIZE}] failed: {e}")
-                # Заполним нулями, чтобы структура была полной
-                for pk in chunk:
-                    balances.setdefault(pk, 0)
+        # Чанкуем запросы через getMultipleAccounts; в полёте не больше MAX_CONCURRENT_CHUNKS
+        results = await asyncio.gather(*(
+            _fetch_chunk(client, sem, pubkeys[i:i+CHUNK_SIZE], i)
+            for i in range(0, len(pubkeys), CHUNK_SIZE)
+        ))
+    for part in results:
+        balances.update(part)
     return balances
 
 def format_sol(lamports: int) -> str:
@@ -152,13 +185,20 @@ async def main():
     print(f"{'PUBKEY':<44}  {'LAMPORTS':>15}  {'SOL':>15}")
     print("-" * 80)
     nonzero = 0
+    failed = 0
     for pk in pubkeys:
-        lam = int(balances.get(pk, 0))
+        lam = balances.get(pk)
+        if lam is None:
+            failed += 1
+            print(f"{pk:<44}  {'ERR':>15}  {'ERR':>15}")
+            continue
         if lam > 0:
             nonzero += 1
         print(f"{pk:<44}  {lam:>15}  {format_sol(lam):>15}")
     print("-" * 80)
     print(f"С ненулевым балансом: {nonzero}/{len(pubkeys)}")
+    if failed:
+        print(f"[ERR] Баланс не получен для {failed} кошельков — перезапусти проверку")
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -0,0 +1,145 @@
+import asyncio
+import os
+import tempfile
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("solana")
+os.environ.setdefault("WALLETS_DIR", tempfile.mkdtemp())
+
+import httpx
+from solana.exceptions import SolanaRpcException
+from solana.rpc.core import RPCException, RPCNoResultException
+from solders.hash import Hash
+from solders.keypair import Keypair
+from solders.system_program import transfer, TransferParams
+
+from app.core import client as client_mod
+from app.core.client import SolanaClient
+
+
+class FakeRpc:
+    """Подменяет AsyncClient: отдаёт заданные исключения по очереди, потом успех."""
+
+    def __init__(self, send_errors=(), status_errors=()):
+        self.send_errors = list(send_errors)
+        self.status_errors = list(status_errors)
+        self.sends = 0
+        self.polls = 0
+        self.blockhash_fetches = 0
+
+    async def get_latest_blockhash(self, commitment=None):
+        self.blockhash_fetches += 1
+        return SimpleNamespace(value=SimpleNamespace(blockhash=Hash.new_unique()))
+
+    async def send_raw_transaction(self, raw_tx, opts=None):
+        self.sends += 1
+        if self.send_errors:
+            raise self.send_errors.pop(0)
+        return SimpleNamespace(value="sig")
+
+    async def get_signature_statuses(self, signatures):
+        self.polls += 1
+        if self.status_errors:
+            raise self.status_errors.pop(0)
+        return SimpleNamespace(value=[SimpleNamespace(confirmations=1)])
+
+    async def close(self):
+        pass
+
+
+async def _no_sleep(*_args, **_kwargs):
+    return None
+
+
+def _transport_error() -> SolanaRpcException:
+    # как в solana-py handle_async_exceptions: (exc, func, *args) — _build_error_message читает args[1]
+    return SolanaRpcException(
+        httpx.ConnectError("connection reset"), FakeRpc.send_raw_transaction, None, SimpleNamespace(),
+    )
+
+
+def _send(rpc: FakeRpc, **kwargs):
+    sc = SolanaClient("http://rpc.invalid")
+    sc._client = rpc
+    payer = Keypair()
+    ix = transfer(TransferParams(from_pubkey=payer.pubkey(), to_pubkey=Keypair().pubkey(), lamports=1))
+
+    async def run():
+        try:
+            return await sc.build_and_send_transaction(
+                instructions=[ix], msg_signer=payer, signers_keypairs=[payer], **kwargs,
+            )
+        finally:
+            await sc.close()
+
+    return sc, asyncio.run(run())
+
+
+@pytest.fixture(autouse=True)
+def fast_sleep(monkeypatch):
+    monkeypatch.setattr(client_mod.asyncio, "sleep", _no_sleep)
+
+
+@pytest.mark.parametrize("error", [
+    _transport_error(),
+    RPCException("node is behind"),
+    RPCNoResultException("no result"),
+])
+def test_send_retries_solana_rpc_errors(error):
+    rpc = FakeRpc(send_errors=[error])
+    _, (sig, success) = _send(rpc)
+    assert sig == "sig"
+    assert success is True
+    assert rpc.sends >= 2
+
+
+@pytest.mark.parametrize("error", [
+    _transport_error(),
+    RPCException("node is behind"),
+    RPCNoResultException("no result"),
+])
+def test_confirm_survives_transient_poll_error(error):
+    rpc = FakeRpc(status_errors=[error])
+    _, (_, success) = _send(rpc, max_retries=1)
+    assert success is True
+    assert rpc.sends == 1
+    assert rpc.polls == 2
+
+
+def test_programming_error_is_not_retried():
+    rpc = FakeRpc(send_errors=[TypeError("bug")])
+    with pytest.raises(TypeError):
+        _send(rpc)
+    assert rpc.sends == 1
+
+
+def test_oversized_transaction_is_rejected_before_send():
+    rpc = FakeRpc()
+    sc = SolanaClient("http://rpc.invalid")
+    sc._client = rpc
+    payer = Keypair()
+    ixs = [
+        transfer(TransferParams(from_pubkey=payer.pubkey(), to_pubkey=Keypair().pubkey(), lamports=1))
+        for _ in range(40)
+    ]
+
+    async def run():
+        try:
+            await sc.build_and_send_transaction(instructions=ixs, msg_signer=payer, signers_keypairs=[payer])
+        finally:
+            await sc.close()
+
+    with pytest.raises(ValueError):
+        asyncio.run(run())
+    assert rpc.sends == 0
+    assert rpc.blockhash_fetches == 0
+
+
+def test_blockhash_error_refetches_blockhash_and_resigns():
+    rpc = FakeRpc(send_errors=[RPCException("Transaction simulation failed: Blockhash not found")])
+    sc, (sig, success) = _send(rpc, max_retries=2)
+    assert success is True
+    assert rpc.blockhash_fetches == 2
+    assert rpc.sends == 2